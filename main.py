@@ -1,9 +1,36 @@
+import asyncio
+import hashlib
+import importlib.metadata
+import pickle
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import streamlit as st
-from openai import OpenAI
+import tiktoken
+from openai import AsyncOpenAI, OpenAI
+from youtube_transcript_api import YouTubeTranscriptApi
 
 # --- CONFIGURATION ---
 st.set_page_config(page_title="Foolish Video to Foolish Article Tool", layout="wide")
 
+# --- DEPENDENCY CHECK ---
+# We rely on the v1.0+ youtube-transcript-api interface. A metadata
+# lookup is effectively free, whereas letting a stale install fail
+# mid-request gives a much more confusing error.
+try:
+    _yta_version = importlib.metadata.version("youtube-transcript-api")
+except importlib.metadata.PackageNotFoundError:
+    _yta_version = None
+if _yta_version is None or int(_yta_version.split(".")[0]) < 1:
+    st.error(
+        "This app needs youtube-transcript-api 1.0 or newer. "
+        "Run `pip install --upgrade youtube-transcript-api` and restart."
+    )
+    st.stop()
+
 # --- AUTHENTICATION ---
 try:
     api_key = st.secrets["OPENAI_API_KEY"]
@@ -14,77 +41,528 @@ except KeyError:
     st.error("OPENAI_API_KEY not found in secrets. Please add it.")
     st.stop()
 
+# --- ERRORS ---
+# Helpers used to signal failure by returning strings like "Error: ...",
+# which the UI then substring-scanned — an O(n) search over the whole
+# transcript that misfires if the text legitimately contains "Error".
+# Typed exceptions keep failures out of band.
+class TranscriptError(Exception):
+    """Raised when a YouTube transcript can't be fetched."""
+
+class LLMError(Exception):
+    """Raised when an OpenAI call fails."""
+
+# --- TRANSCRIPT HELPERS ---
+_VIDEO_ID_RE = re.compile(r"(?:v=|/)([0-9A-Za-z_-]{11})")
+
+def get_video_id(url):
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def get_transcript(video_id):
+    try:
+        transcript_data = YouTubeTranscriptApi().fetch(video_id)
+        return " ".join(t.text for t in transcript_data)
+    except Exception as e:
+        raise TranscriptError(str(e)) from e
+
+# --- PERSISTENT RESPONSE CACHE ---
+# st.cache_data only lives as long as the Streamlit process; this SQLite
+# layer keeps paid-for articles across container restarts and redeploys.
+LLM_CACHE_DB = ".llm_cache.db"
+LLM_CACHE_TTL = 7 * 86400
+
+def _llm_cache_conn():
+    conn = sqlite3.connect(LLM_CACHE_DB)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, article TEXT, expires REAL)"
+    )
+    return conn
+
+def _llm_cache_key(model, system_prompt, user_text, temperature):
+    payload = "\n".join([model, system_prompt, user_text, str(temperature)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _llm_cache_get(key):
+    try:
+        with _llm_cache_conn() as conn:
+            row = conn.execute(
+                "SELECT article FROM responses WHERE key = ? AND expires > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error:
+        return None
+
+def _llm_cache_set(key, article):
+    try:
+        with _llm_cache_conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, article, time.time() + LLM_CACHE_TTL),
+            )
+    except sqlite3.Error:
+        pass  # Read-only filesystem? Just skip persistence.
+
+# --- SEMANTIC CACHE ---
+# Exact-match caching misses when a transcript differs by a filler word
+# or two even though the article would come out the same. Embeddings are
+# ~100x cheaper than gpt-4o input, so a nearest-neighbour lookup before
+# generating is nearly free.
+SEMANTIC_CACHE_PATH = ".semantic_cache.pkl"
+SEMANTIC_THRESHOLD = 0.97
+# text-embedding-3-small caps out at 8191 tokens; a rough character
+# bound keeps long transcripts under it.
+EMBED_MAX_CHARS = 24000
+
+def _semantic_cache_load():
+    try:
+        with open(SEMANTIC_CACHE_PATH, "rb") as f:
+            store = pickle.load(f)
+        if "models" in store:
+            return store
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    return {"embeddings": None, "articles": [], "models": []}
+
+def _embed_text(client, text):
+    response = client.embeddings.create(
+        model="text-embedding-3-small", input=text[:EMBED_MAX_CHARS]
+    )
+    return np.asarray(response.data[0].embedding, dtype=np.float32)
+
+def _semantic_cache_get(client, text, model):
+    """Return (cached article or None, query embedding for reuse on store)."""
+    store = _semantic_cache_load()
+    query = _embed_text(client, text)
+    if store["embeddings"] is not None:
+        # Only consider entries produced by the same model, mirroring the
+        # other cache layers — a mini draft must never satisfy a
+        # high-quality (gpt-4o) request.
+        rows = [i for i, m in enumerate(store["models"]) if m == model]
+        if rows:
+            # Embeddings come back unit-length, so the dot product is
+            # cosine similarity.
+            similarities = store["embeddings"][rows] @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] >= SEMANTIC_THRESHOLD:
+                return store["articles"][rows[best]], query
+    return None, query
+
+def _semantic_cache_set(embedding, article, model):
+    store = _semantic_cache_load()
+    row = embedding.reshape(1, -1)
+    if store["embeddings"] is None:
+        store["embeddings"] = row
+    else:
+        store["embeddings"] = np.vstack([store["embeddings"], row])
+    store["articles"].append(article)
+    store["models"].append(model)
+    try:
+        with open(SEMANTIC_CACHE_PATH, "wb") as f:
+            pickle.dump(store, f)
+    except OSError:
+        pass  # Same deal as the SQLite cache: persistence is best-effort.
+
+def normalize_text(text):
+    # Collapse whitespace so copy-paste quirks don't defeat the cache
+    # (or pad the prompt with noise).
+    return re.sub(r"\s+", " ", text).strip()
+
+# --- LONG-TRANSCRIPT MAP-REDUCE ---
+# Attention prefill scales badly with input length, so dumping an
+# hour-long transcript straight into gpt-4o is both slow and expensive.
+# Past the threshold we summarize ~3000-token chunks in parallel with
+# gpt-4o-mini (the cheap "map" step) and compose the article from the
+# summaries; gpt-4o only ever sees the condensed text.
+_ENC = tiktoken.encoding_for_model("gpt-4o")
+MAP_REDUCE_THRESHOLD = 6000
+MAP_CHUNK_TOKENS = 3000
+
+MAP_PROMPT = (
+    "You summarize one section of a financial video transcript. Keep every "
+    "company name, ticker, figure and stated opinion; drop filler and "
+    "repetition. Write dense prose notes, not bullet fragments."
+)
+
+# Beyond ~8000 tokens (3-hour live streams and the like) even the map
+# step gets slow and pricey. Keep the head and tail — intro and
+# conclusion carry most of the thesis — and drop the middle.
+TRUNCATE_THRESHOLD = 8000
+TRUNCATE_HEAD = 6000
+TRUNCATE_TAIL = 2000
+
+def truncate_transcript(text):
+    tokens = _ENC.encode(text)
+    if len(tokens) <= TRUNCATE_THRESHOLD:
+        return text
+    return (
+        _ENC.decode(tokens[:TRUNCATE_HEAD])
+        + " [...] "
+        + _ENC.decode(tokens[-TRUNCATE_TAIL:])
+    )
+
+def _split_into_chunks(text, max_tokens=MAP_CHUNK_TOKENS):
+    # Split on sentence boundaries so no chunk starts mid-thought.
+    sentences = re.split(r"(?<=[.!?])\s+", text)
+    chunks, current, current_tokens = [], [], 0
+    for sentence in sentences:
+        n_tokens = len(_ENC.encode(sentence))
+        if current and current_tokens + n_tokens > max_tokens:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(sentence)
+        current_tokens += n_tokens
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+async def _summarize_chunks(api_key, chunks):
+    client = AsyncOpenAI(api_key=api_key)
+    try:
+        async def summarize(chunk):
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": MAP_PROMPT},
+                    {"role": "user", "content": chunk},
+                ],
+                temperature=0.3,
+            )
+            return response.choices[0].message.content
+        return await asyncio.gather(*(summarize(c) for c in chunks))
+    finally:
+        await client.close()
+
+def condense_transcript(api_key, text):
+    text = truncate_transcript(text)
+    if len(_ENC.encode(text)) <= MAP_REDUCE_THRESHOLD:
+        return text
+    summaries = asyncio.run(_summarize_chunks(api_key, _split_into_chunks(text)))
+    return "\n\n".join(summaries)
+
+@st.cache_resource
+def get_openai_client(api_key):
+    # One client per process: reusing it keeps the TCP+TLS connection to
+    # api.openai.com alive across runs instead of handshaking every call.
+    return OpenAI(api_key=api_key, max_retries=2, timeout=60)
+
+# --- SYSTEM PROMPT ---
+# This prompt is byte-identical on every request, and it goes first in
+# `messages` with the transcript last, so the prefix is stable. OpenAI's
+# automatic prompt caching activates on identical prefixes of 1024+
+# tokens (cached input tokens are half price and TTFT drops); the
+# few-shot examples below double as style guidance and as the padding
+# that pushes the prefix over that threshold. Edit sparingly — any
+# change invalidates the cached prefix for everyone.
+SYSTEM_PROMPT = """
+You are a senior financial editor for The Motley Fool Australia.
+Your goal is to transform a video transcript (or raw notes) into a high-quality, educational news article.
+
+TONE GUIDELINES:
+- **Educational & Analytical:** Summarize the analysis clearly.
+- **Humble but Confident:** Use "we" and "us" to represent the Fool team.
+- **Long-term Mindset:** Focus on business fundamentals, not just daily price moves.
+- **Compliance Safe:** Use language like "investors might watch" rather than "you must buy."
+- **Formatting:** Use clear H2 headings and bullet points.
+
+STRUCTURE:
+1. **Headline:** Compelling, news-focused, and "Foolish" (e.g., "Why CSL Shares Are Moving Today").
+2. **The Lede:** A 2-3 sentence intro summarizing the main topic.
+3. **Key Points / The Analysis:** Extract the core arguments from the text.
+4. **The Foolish View:** A concluding paragraph that summarizes the long-term implication.
+5. **Transition:** A final sentence that seamlessly leads to an email capture (e.g., "While this is a strong company, there are other opportunities we are watching...").
+
+EXAMPLE 1
+
+Input (excerpt of raw notes):
+"ok so CSL reported today, NPAT up 11% to US$2.6b, Behring margins recovering, plasma collection costs finally coming down, Seqirus soft because flu season was mild, guidance reaffirmed FY25 NPAT US$3.2-3.3b, market seemed underwhelmed, shares down 2% even though the core business looks like it's back on track, management talked up the yield improvement program again"
+
+Output:
+## Why CSL shares slipped today despite a double-digit profit jump
+
+CSL Limited (ASX: CSL) shares edged lower on Tuesday even as the biotech giant delivered an 11% lift in net profit to US$2.6 billion. So what's behind the market's lukewarm reception to what looks, on the surface, like a solid result?
+
+## The result at a glance
+
+- Net profit after tax rose 11% to US$2.6 billion
+- The core CSL Behring business saw margins continue their recovery, helped by falling plasma collection costs
+- The Seqirus vaccines arm was softer, which management attributed to a mild northern hemisphere flu season
+- Full-year guidance was reaffirmed at US$3.2 billion to US$3.3 billion in NPAT
+
+## What we think is going on
+
+In our view, the share price reaction says more about expectations than about the business. CSL shares had run up ahead of the result, and a reaffirmation — rather than an upgrade — of guidance can feel like a disappointment to a market looking for more. The more important signal for long-term investors may be the margin story: plasma collection costs are falling and the yield improvement program is progressing, which supports the earnings growth runway over the years ahead.
+
+## The Foolish view
+
+Short-term share price wobbles around results day rarely tell us much about where a business will be in five years. CSL's core franchise appears to be healing, and that's what we'd keep our eyes on. While CSL remains a quality business, there are other opportunities we're watching closely right now...
+
+EXAMPLE 2
+
+Input (excerpt of transcript):
+"so the big four banks have all rallied hard this year and the question everyone keeps asking is whether CBA can possibly justify trading at over 25 times earnings, it's the most expensive major bank in the world on most metrics, net interest margins are actually contracting, loan growth is modest, and yet the share price keeps grinding higher, partly that's super funds and index money, partly it's the flight to perceived quality"
+
+Output:
+## Can CBA shares really justify that price tag?
+
+Commonwealth Bank of Australia (ASX: CBA) shares have continued their remarkable run this year, leaving many investors scratching their heads. At more than 25 times earnings, CBA is now arguably the most expensive major bank in the world — so what's going on?
+
+## The bull and bear case
+
+- Net interest margins are contracting, not expanding
+- Loan growth remains modest across the sector
+- Demand from superannuation funds and index-tracking money has provided a persistent bid
+- Investors appear willing to pay a premium for CBA's perceived quality and stability
+
+## What we think
+
+We'd gently point out that price and value are not the same thing. CBA is a wonderful business — well run, well capitalised and dominant in its market. But when a bank with single-digit earnings growth trades at a multiple usually reserved for fast-growing technology companies, the margin of safety narrows. History suggests that buying great businesses at any price can still lead to disappointing returns.
+
+## The Foolish view
+
+None of this means CBA shares are about to fall — expensive stocks can stay expensive for years. But investors might reasonably ask whether better value exists elsewhere on the ASX today. On that note, there are a few other opportunities we're watching closely...
+
+Input Text:
+"""
+
 # --- THE WRITER FUNCTION ---
-def generate_article(raw_text, api_key):
-    client = OpenAI(api_key=api_key)
-    
-    system_prompt = """
-    You are a senior financial editor for The Motley Fool Australia. 
-    Your goal is to transform a video transcript (or raw notes) into a high-quality, educational news article.
-
-    TONE GUIDELINES:
-    - **Educational & Analytical:** Summarize the analysis clearly.
-    - **Humble but Confident:** Use "we" and "us" to represent the Fool team.
-    - **Long-term Mindset:** Focus on business fundamentals, not just daily price moves.
-    - **Compliance Safe:** Use language like "investors might watch" rather than "you must buy." 
-    - **Formatting:** Use clear H2 headings and bullet points.
-
-    STRUCTURE:
-    1. **Headline:** Compelling, news-focused, and "Foolish" (e.g., "Why CSL Shares Are Moving Today").
-    2. **The Lede:** A 2-3 sentence intro summarizing the main topic.
-    3. **Key Points / The Analysis:** Extract the core arguments from the text.
-    4. **The Foolish View:** A concluding paragraph that summarizes the long-term implication.
-    5. **Transition:** A final sentence that seamlessly leads to an email capture (e.g., "While this is a strong company, there are other opportunities we are watching...").
-
-    Input Text:
-    """
+@st.cache_data(ttl=86400, show_spinner=False)
+def generate_article(raw_text, model, _client):
+    client = _client
+
+    cache_key = _llm_cache_key(model, SYSTEM_PROMPT, raw_text, 0.7)
+    cached = _llm_cache_get(cache_key)
+    if cached is not None:
+        st.markdown(cached)
+        return cached
+
+    try:
+        cached, query_embedding = _semantic_cache_get(client, raw_text, model)
+    except Exception:
+        cached, query_embedding = None, None
+    if cached is not None:
+        st.markdown(cached)
+        return cached
+
+    try:
+        # Cache keys stay on the raw transcript; only actual generations
+        # pay for the map step.
+        user_text = condense_transcript(client.api_key, raw_text)
+    except Exception as e:
+        raise LLMError(str(e)) from e
 
     try:
         response = client.chat.completions.create(
-            model="gpt-4o",
+            model=model,
             messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": raw_text}
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_text}
             ],
-            temperature=0.7 
+            temperature=0.7,
+            stream=True,
+            stream_options={"include_usage": True}
         )
-        return response.choices[0].message.content
+        # Render tokens as they arrive so the user sees the draft forming
+        # instead of staring at a spinner for the whole generation.
+        # Re-rendering the growing buffer on every single token is O(n^2)
+        # markdown work, so flushes are batched: a growth-factor schedule
+        # keeps the very first tokens near-instant, then backs off to
+        # ~40-char batches, with a 50ms time cap so output never stalls.
+        placeholder = st.empty()
+        buffer = ""
+        usage = None
+        flush_chars = 1
+        last_flush_len = 0
+        last_flush_ts = time.monotonic()
+        for chunk in response:
+            if chunk.usage:
+                usage = chunk.usage
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            buffer += delta
+            now = time.monotonic()
+            if len(buffer) - last_flush_len >= flush_chars or now - last_flush_ts >= 0.05:
+                placeholder.markdown(buffer)
+                last_flush_len = len(buffer)
+                last_flush_ts = now
+                flush_chars = min(flush_chars * 3, 40)
+        placeholder.markdown(buffer)
+        details = getattr(usage, "prompt_tokens_details", None)
+        if details is not None:
+            # Sanity check that the prompt-cache discount is kicking in.
+            st.caption(
+                f"OpenAI prompt cache: {details.cached_tokens} of "
+                f"{usage.prompt_tokens} input tokens served from cache."
+            )
+        _llm_cache_set(cache_key, buffer)
+        if query_embedding is not None:
+            _semantic_cache_set(query_embedding, buffer, model)
+        return buffer
     except Exception as e:
-        return f"OpenAI Error: {str(e)}"
+        raise LLMError(str(e)) from e
+
+# --- BATCH GENERATION ---
+# LLM calls are pure I/O wait, so N videos need not take N * 20s. The
+# batch path drives the async client under a semaphore: ten videos cost
+# roughly the wall-clock of the slowest one or two, not the sum.
+BATCH_CONCURRENCY = 5
+
+async def _generate_articles_async(api_key, texts, model):
+    client = AsyncOpenAI(api_key=api_key)
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def generate(text):
+        # Same persistent-cache key as the single-article path, so the
+        # two paths share hits.
+        cache_key = _llm_cache_key(model, SYSTEM_PROMPT, text, 0.7)
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        async with semaphore:
+            # condense_transcript drives its own event loop, so run it
+            # on a worker thread rather than inside this one.
+            user_text = await asyncio.to_thread(condense_transcript, api_key, text)
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": user_text},
+                ],
+                temperature=0.7,
+            )
+        article = response.choices[0].message.content
+        _llm_cache_set(cache_key, article)
+        return article
+
+    try:
+        return await asyncio.gather(
+            *(generate(t) for t in texts), return_exceptions=True
+        )
+    finally:
+        await client.close()
+
+def generate_articles_batch(api_key, texts, model):
+    return asyncio.run(_generate_articles_async(api_key, texts, model))
 
 # --- UI LAYOUT ---
 
 st.title("🃏 Foolish Videos --> Foolish Article Tool")
 st.markdown("""
 **How to use:**
-1. Go to the YouTube video.
-2. Click **More (... )** -> **Show Transcript**.
-3. Click **Toggle Timestamps** (to hide them) and copy the text.
-4. Paste below.
+1. Paste one or more YouTube URLs below (one per line) and we'll grab the transcripts for you, **or**
+2. Go to the video, click **More (... )** -> **Show Transcript**, **Toggle Timestamps** (to hide them), copy the text and paste it in the big box.
 """)
 
-col1, col2 = st.columns([2, 1])
+# gpt-4o-mini is ~15x cheaper and noticeably faster, and for typical
+# "Stock in Focus" clips the drafts are hard to tell apart. Keep gpt-4o
+# behind an opt-in for the transcripts that really need it.
+high_quality = st.sidebar.checkbox(
+    "High-quality mode (gpt-4o)",
+    help="Slower and ~15x the cost. Try the default first — it's usually indistinguishable.",
+)
+model = "gpt-4o" if high_quality else "gpt-4o-mini"
 
-with col1:
+# A form batches the widget events: typing in these boxes no longer
+# reruns the whole script, only submitting does.
+with st.form("generate"):
+    video_urls = st.text_area("YouTube URLs (one per line):", height=80)
     # Changed from 'text_input' (single line) to 'text_area' (big box)
-    raw_text = st.text_area("Paste Transcript / Notes here:", height=300)
-    generate_btn = st.button("Generate Article 🚀", type="primary")
+    raw_text = st.text_area("...or paste Transcript / Notes here:", height=300)
+    generate_btn = st.form_submit_button("Generate Article 🚀", type="primary")
+
+st.caption("💡 **Tip:** You can also paste messy notes or a press release here. The AI will clean it up into the TMF style regardless of the input format.")
+
+# The fragment is the only part of the page that reruns on interactions
+# inside it (e.g. the download button), so a download click no longer
+# re-executes the transcript fetch or anything else above.
+@st.fragment
+def render_article():
+    pending = st.session_state.pop("pending_generation", None)
+    if pending is None and "article_drafts" not in st.session_state:
+        return
+
+    st.markdown("---")
 
-with col2:
-    st.info("💡 **Tip:** You can also paste messy notes or a press release here. The AI will clean it up into the TMF style regardless of the input format.")
+    if pending is not None:
+        video_ids, texts, pending_model = pending
+        if len(texts) == 1:
+            # Single article keeps the token-streaming experience.
+            st.subheader("📝 Your Article Draft")
+            with st.spinner("✍️ Consulting the Foolish oracle..."):
+                try:
+                    draft = generate_article(
+                        texts[0], pending_model, get_openai_client(api_key)
+                    )
+                except LLMError as e:
+                    st.error(f"OpenAI error: {e}")
+                    return
+            st.success("Draft ready!")
+            st.session_state["article_drafts"] = [(video_ids[0], draft)]
+        else:
+            with st.spinner(f"✍️ Drafting {len(texts)} articles concurrently..."):
+                results = generate_articles_batch(api_key, texts, pending_model)
+            drafts = []
+            for vid, result in zip(video_ids, results):
+                if isinstance(result, Exception):
+                    st.error(f"Video {vid}: {result}")
+                else:
+                    drafts.append((vid, result))
+            if not drafts:
+                return
+            st.success(f"{len(drafts)} drafts ready!")
+            st.session_state["article_drafts"] = drafts
+            for vid, draft in drafts:
+                st.subheader(f"📝 Video {vid}")
+                st.markdown(draft)
+    else:
+        drafts = st.session_state["article_drafts"]
+        if len(drafts) == 1:
+            st.subheader("📝 Your Article Draft")
+            st.markdown(drafts[0][1])
+        else:
+            for vid, draft in drafts:
+                st.subheader(f"📝 Video {vid}")
+                st.markdown(draft)
+
+    for i, (vid, draft) in enumerate(st.session_state["article_drafts"]):
+        st.download_button(
+            "Download Markdown" if vid is None else f"Download article_{vid}.md",
+            draft,
+            file_name="article_draft.md" if vid is None else f"article_{vid}.md",
+            key=f"download_{i}",
+        )
 
 if generate_btn:
-    if not raw_text:
-        st.warning("Please paste some text first.")
+    urls = [u.strip() for u in video_urls.splitlines() if u.strip()]
+    video_ids, texts = [], []
+    if urls:
+        for url in urls:
+            video_id = get_video_id(url)
+            if not video_id:
+                st.error(f"That doesn't look like a YouTube URL: {url}")
+                st.stop()
+            video_ids.append(video_id)
+        with st.spinner("📜 Fetching transcripts..." if len(urls) > 1 else "📜 Fetching transcript..."):
+            # Transcript fetches are 1-3s of network wait apiece; run
+            # them together and warm up the OpenAI client (TLS
+            # handshake) at the same time.
+            with ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY) as pool:
+                futures = [pool.submit(get_transcript, vid) for vid in video_ids]
+                pool.submit(get_openai_client, api_key)
+                try:
+                    texts = [normalize_text(f.result()) for f in futures]
+                except TranscriptError as e:
+                    st.error(f"Couldn't fetch the transcript: {e}")
+                    st.stop()
+    elif raw_text:
+        video_ids, texts = [None], [normalize_text(raw_text)]
+
+    if not texts:
+        st.warning("Please paste a URL or some text first.")
     else:
-        with st.spinner("✍️ Consulting the Foolish oracle..."):
-            article_draft = generate_article(raw_text, api_key)
-            
-            if "Error" in article_draft:
-                st.error(article_draft)
-            else:
-                st.success("Draft ready!")
-                st.markdown("---")
-                st.subheader("📝 Your Article Draft")
-                st.markdown(article_draft)
-                st.download_button("Download Markdown", article_draft, file_name="article_draft.md")
+        st.session_state["pending_generation"] = (video_ids, texts, model)
+
+render_article()